@@ -36,6 +36,7 @@ sys.path.insert(0, str(PROJECT_ROOT))
 from entry_points.run_pipeline import run_pipeline  # noqa: E402
 from entry_points.generate_report import generate_report  # noqa: E402
 from vision_aid.ingestion.file_crawler import fetch_page, fetch_pages_nested  # noqa: E402
+from processing_scripts.json_bytes import dumps_bytes  # noqa: E402
 from processing_scripts.llm_client.client import is_openai_model  # noqa: E402
 
 
@@ -268,8 +269,7 @@ class AuditHandler(BaseHTTPRequestHandler):
         self.end_headers()
 
         def send_event(obj: dict) -> None:
-            line = json.dumps(obj, ensure_ascii=False) + "\n"
-            self.wfile.write(line.encode("utf-8"))
+            self.wfile.write(dumps_bytes(obj) + b"\n")
             self.wfile.flush()
 
         return send_event
@@ -551,7 +551,7 @@ class AuditHandler(BaseHTTPRequestHandler):
             self._send_json({"valid": False, "error": str(exc)})
 
     def _send_json(self, obj: dict, status: int = 200):
-        body = json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+        body = dumps_bytes(obj)
         self.send_response(status)
         self.send_header("Content-Type", "application/json; charset=utf-8")
         self.send_header("Content-Length", str(len(body)))
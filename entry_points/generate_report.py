@@ -15,13 +15,32 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import csv
+import io
 import json
+import operator
+import os
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, fields
+from functools import partial
+from itertools import chain
 from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
 from bs4 import BeautifulSoup
 
+try:
+    import orjson
+except ImportError:  # optional speedup — stdlib json is used otherwise
+    orjson = None
+
+# Ensure project root is on sys.path so we can import vision_aid/
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from vision_aid.ingestion.pull_html import read_html  # noqa: E402
+
 # ── Deduplication prompt ─────────────────────────────────────────────────────
 
 _DEDUP_PROMPT = """\
@@ -48,9 +67,13 @@ Respond with ONLY a JSON array, e.g.: [3, 7, 12]
 
 # ── CSV schema ──────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ReportRow:
-    """One row in the final CSV report (14 columns)."""
+    """One row in the final CSV report (14 columns).
+
+    Slotted to keep per-row memory down on large reports; rows are never
+    compared, so field-wise ``__eq__`` is not generated.
+    """
 
     ID: int = 0
     element_name: str = ""
@@ -68,14 +91,64 @@ class ReportRow:
     reported_by: str = ""
 
 
-CSV_COLUMNS = [f.name for f in fields(ReportRow)]
+CSV_COLUMNS: tuple[str, ...] = tuple(f.name for f in fields(ReportRow))
+
+# Fetches every CSV column from a ReportRow as one tuple, in column order.
+_ROW_GETTER = operator.attrgetter(*CSV_COLUMNS)
+
+# Characters that force a CSV field to be quoted (csv.QUOTE_MINIMAL rules).
+_CSV_UNSAFE = re.compile(r'[",\r\n]')
+
+
+def _csv_line(values: Iterable[Any]) -> bytes:
+    """Encode one CSV record the way ``csv.writer`` does, as UTF-8 bytes.
+
+    Most report fields hold no comma, quote or newline, so they are written
+    as-is; only the rest go through quoting. Lines end in CRLF.
+    """
+    out = []
+    for value in values:
+        if value is None:
+            value = ""
+        elif not isinstance(value, str):
+            value = str(value)
+        if _CSV_UNSAFE.search(value):
+            value = '"' + value.replace('"', '""') + '"'
+        out.append(value)
+    return (",".join(out) + "\r\n").encode("utf-8")
 
 
 # ── Helpers ─────────────────────────────────────────────────────────────────
 
+# ```json ... ``` (or bare ```) wrapper around an LLM response.
+_FENCE_RE = re.compile(r"```(?:json)?\s*\n?(.*?)```", re.DOTALL)
+
+# A quoted string followed by an unquoted "or <alternative>" before , ] or }.
+_REPAIR_RE = re.compile(r'("(?:[^"\\]|\\.)*")\s+or\s+[^,\]\}]+')
+
+
+def _loads(data: bytes | str):
+    """Parse JSON with orjson when installed, falling back to the stdlib.
+
+    orjson is stricter (no NaN, no big ints, UTF-8 only), so anything it
+    rejects is retried with ``json.loads``; undecodable bytes are replaced
+    rather than raising, matching how files were read before.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    if isinstance(data, bytes):
+        data = data.decode("utf-8", errors="replace")
+    return json.loads(data)
+
+
 def strip_code_fence(text: str) -> str:
     """Remove ```json ... ``` wrappers from an LLM response string."""
-    m = re.search(r"```(?:json)?\s*\n?(.*?)```", text, re.DOTALL)
+    if "```" not in text:
+        return text.strip()
+    m = _FENCE_RE.search(text)
     return m.group(1).strip() if m else text.strip()
 
 
@@ -87,13 +160,7 @@ def _repair_json(text: str) -> str:
     by truncating at the first unquoted `or` after a closing quote.
     """
     # Fix: "string value" or alternative text  →  "string value"
-    # This matches a quoted string followed by unquoted text before a comma/bracket.
-    text = re.sub(
-        r'("(?:[^"\\]|\\.)*")\s+or\s+[^,\]\}]+',
-        r'\1',
-        text,
-    )
-    return text
+    return _REPAIR_RE.sub(r"\1", text)
 
 
 def safe_parse_json(text: str):
@@ -102,26 +169,50 @@ def safe_parse_json(text: str):
     Falls back to a repair pass if initial parsing fails due to common
     LLM malformations like inline alternative text.
     """
-    cleaned = strip_code_fence(text)
+    # Most responses are bare JSON — skip the fence search for those.
+    stripped = text.lstrip()
+    if stripped[:1] in ("{", "["):
+        cleaned = stripped.rstrip()
+    else:
+        cleaned = strip_code_fence(text)
     try:
-        return json.loads(cleaned)
+        return _loads(cleaned)
     except json.JSONDecodeError:
         repaired = _repair_json(cleaned)
-        return json.loads(repaired)
+        return _loads(repaired)
+
 
+def load_prompt_file(path: str | Path | None) -> dict | None:
+    """Load a prompt output JSON file and return the parsed structure.
 
-def load_prompt_file(path: Path) -> dict | None:
-    """Load a prompt output JSON file and return the parsed structure."""
-    if not path.exists():
+    Returns None when *path* is None (i.e. the prompt produced no file).
+    """
+    if path is None:
         return None
-    with open(path, encoding="utf-8", errors="replace") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
+
+def _scan_prompt_files(prompts_dir: Path) -> dict[str, str]:
+    """Map each prompt name to its ``prompts/<name>.json`` path in one directory scan.
+
+    Replaces a per-prompt ``exists()`` stat with a single ``os.scandir`` pass.
+    """
+    try:
+        with os.scandir(prompts_dir) as entries:
+            return {
+                entry.name[:-5]: entry.path
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            }
+    except FileNotFoundError:
+        return {}
 
 
 def extract_page_title_from_payload(prompt_data: dict) -> str:
     """Pull the page title string from the page_title prompt's payload_slice."""
     try:
-        payload = json.loads(prompt_data["payload_slice"])
+        payload = _loads(prompt_data["payload_slice"])
         return payload.get("title", "")
     except (json.JSONDecodeError, KeyError):
         return ""
@@ -223,6 +314,12 @@ _NAV_TERMS = {
     "privacy policy", "terms of use", "cookie policy",
 }
 
+# Issue-title patterns the filters key on, and what counts as "clear" text.
+_UNCLEAR_LINK_RE = re.compile(r'Unclear link: "(.+?)"')
+_MIS_MARKED_RE = re.compile(r"mis-marked as decorative: (.+)")
+_PHONE_TEXT_RE = re.compile(r"^[\d\-\+\(\)\s]+$")
+_HEADING_TAG_RE = re.compile(r"^h[1-6]$")
+
 
 def _load_html_for_filtering(output_dir: Path) -> BeautifulSoup | None:
     """Try to load the audited HTML for false-positive checking.
@@ -234,16 +331,14 @@ def _load_html_for_filtering(output_dir: Path) -> BeautifulSoup | None:
     if not manifest_path.exists():
         return None
     try:
-        with open(manifest_path, encoding="utf-8") as f:
-            manifest = json.load(f)
+        manifest = _loads(manifest_path.read_bytes())
         html_path = manifest.get("html_file")
         if not html_path:
             return None
         html_path = Path(html_path)
         if not html_path.exists():
             return None
-        with open(html_path, "r", encoding="utf-8", errors="replace") as f:
-            return BeautifulSoup(f.read(), "lxml")
+        return BeautifulSoup(read_html(html_path, errors="replace"), "lxml")
     except Exception:
         return None
 
@@ -265,22 +360,23 @@ def _build_link_nav_index(soup: BeautifulSoup) -> set[str]:
 def _is_link_fp(row: ReportRow, nav_link_texts: set[str]) -> bool:
     """Return True if a link clarity finding is a likely false positive."""
     issue = row.issue_title
-    match = re.search(r'Unclear link: "(.+?)"', issue)
+    match = _UNCLEAR_LINK_RE.search(issue)
     if not match:
         return False
 
     link_text = match.group(1).strip()
+    lowered = link_text.lower()
 
     # Standard nav terms are clear in context
-    if link_text.lower() in _NAV_TERMS:
+    if lowered in _NAV_TERMS:
         return True
 
     # Phone numbers with digits are clear (especially with tel: href)
-    if re.match(r"^[\d\-\+\(\)\s]+$", link_text):
+    if _PHONE_TEXT_RE.match(link_text):
         return True
 
     # Links inside <nav> or <footer> are clear in context
-    if link_text.lower() in nav_link_texts:
+    if lowered in nav_link_texts:
         return True
 
     return False
@@ -289,7 +385,7 @@ def _is_link_fp(row: ReportRow, nav_link_texts: set[str]) -> bool:
 def _is_decorative_img_fp(row: ReportRow, soup: BeautifulSoup | None) -> bool:
     """Return True if a 'mis-marked as decorative' finding is a likely false positive."""
     issue = row.issue_title
-    match = re.search(r"mis-marked as decorative: (.+)", issue)
+    match = _MIS_MARKED_RE.search(issue)
     if not match:
         return False
 
@@ -307,12 +403,12 @@ def _is_decorative_img_fp(row: ReportRow, soup: BeautifulSoup | None) -> bool:
                 parent = img.parent
                 if parent:
                     # Check if there's a heading sibling
-                    heading = parent.find(re.compile(r"^h[1-6]$"))
+                    heading = parent.find(_HEADING_TAG_RE)
                     if heading and heading.get_text(strip=True):
                         return True
                     # Also check parent's parent
                     if parent.parent:
-                        heading = parent.parent.find(re.compile(r"^h[1-6]$"))
+                        heading = parent.parent.find(_HEADING_TAG_RE)
                         if heading and heading.get_text(strip=True):
                             return True
                 break
@@ -363,7 +459,7 @@ def _is_svg_fp(row: ReportRow, soup: BeautifulSoup | None) -> bool:
 
 
 def filter_false_positives(
-    rows: list[ReportRow],
+    rows: Iterable[ReportRow],
     soup: BeautifulSoup | None,
 ) -> tuple[list[ReportRow], list[ReportRow]]:
     """Split rows into kept findings and suppressed false positives.
@@ -446,6 +542,10 @@ _WCAG_CRITERION_IMPACT: dict[str, str] = {
 }
 
 
+# Anything that is not part of a dotted criterion number, e.g. a "WCAG " prefix.
+_NON_CRITERION_RE = re.compile(r"[^0-9.]")
+
+
 def _derive_impact(rule_id: str = "", wcag_criterion: str = "") -> str:
     """Return an impact level (Critical/Serious/Moderate/Minor) for a finding.
 
@@ -455,7 +555,7 @@ def _derive_impact(rule_id: str = "", wcag_criterion: str = "") -> str:
     if rule_id and rule_id.lower() in _RULE_IMPACT:
         return _RULE_IMPACT[rule_id.lower()]
     # wcag_criterion may be "1.1.1" or "WCAG 1.1.1" — normalise
-    criterion = re.sub(r"[^0-9.]", "", wcag_criterion or "").strip(".")
+    criterion = _NON_CRITERION_RE.sub("", wcag_criterion or "").strip(".")
     if criterion in _WCAG_CRITERION_IMPACT:
         return _WCAG_CRITERION_IMPACT[criterion]
     # WCAG A/AA heuristic based on first digit
@@ -469,6 +569,29 @@ def _derive_impact(rule_id: str = "", wcag_criterion: str = "") -> str:
 
 # ── Programmatic findings normalizer ───────────────────────────────────────
 
+def _unpack_location(location: dict, _get=dict.get) -> tuple:
+    """Return (tag, id, class, snippet, href, src) from a finding's location.
+
+    Uses the unbound ``dict.get`` to skip a bound-method lookup per field.
+    href/src prefer explicit fields and fall back to the attributes dict.
+    """
+    attrs = _get(location, "attributes") or {}
+    return (
+        # Tags repeat heavily across a document; intern them once.
+        sys.intern(_get(location, "tag") or ""),
+        _get(location, "id", ""),
+        _get(location, "class"),
+        _get(location, "text_preview") or _get(location, "snippet", ""),
+        _get(location, "href") or _get(attrs, "href", ""),
+        _get(location, "src") or _get(attrs, "src", ""),
+    )
+
+
+def _unpack_wcag(wcag: dict, _get=dict.get) -> tuple[str, str]:
+    """Return (criterion, name) from a legacy-schema ``wcag`` dict."""
+    return _get(wcag, "criterion", ""), _get(wcag, "name", "")
+
+
 def normalize_programmatic(findings: list[dict], page_title: str,
                            log_date: str) -> list[ReportRow]:
     """Convert programmatic_findings.json entries to ReportRow objects.
@@ -478,18 +601,11 @@ def normalize_programmatic(findings: list[dict], page_title: str,
     backwards compatibility.
     """
     rows = []
+    rows_append = rows.append
     for f in findings:
         # ── Resolve element / location ──────────────────────────────────
         location = f.get("location") or f.get("element") or {}
-        tag = location.get("tag", "")
-        el_id = location.get("id", "")
-        el_classes = location.get("class")
-        snippet = location.get("text_preview") or location.get("snippet", "")
-
-        # Pull href/src from explicit fields first, then fall back to attributes dict
-        attrs = location.get("attributes") or {}
-        href = location.get("href") or attrs.get("href", "")
-        raw_src = location.get("src") or attrs.get("src", "")
+        tag, el_id, el_classes, snippet, href, raw_src = _unpack_location(location)
         src = raw_src.split("/")[-1][:60] if raw_src else ""
 
         if el_id:
@@ -518,9 +634,7 @@ def normalize_programmatic(findings: list[dict], page_title: str,
         description = f.get("description", "")
 
         # ── Resolve WCAG criterion (legacy schema has it, new one may not)
-        wcag = f.get("wcag", {})
-        criterion = wcag.get("criterion", "")
-        wcag_name = wcag.get("name", "")
+        criterion, wcag_name = _unpack_wcag(f.get("wcag") or {})
 
         # ── Build row ───────────────────────────────────────────────────
         issue_title = f"{rule_id}: {rule_name}" if rule_id else rule_name
@@ -535,7 +649,7 @@ def normalize_programmatic(findings: list[dict], page_title: str,
         # Use generic fix recommendation if available, fall back to description
         recommendation = _GENERIC_FIXES.get(rule_id, description or rule_name)
 
-        rows.append(ReportRow(
+        rows_append(ReportRow(
             element_name=element_name,
             page_title=page_title,
             issue_title=issue_title,
@@ -553,60 +667,79 @@ def normalize_programmatic(findings: list[dict], page_title: str,
 
 
 # ── LLM prompt normalizers ─────────────────────────────────────────────────
+#
+# Each normalizer gets a *new_row* factory with the run-wide fields
+# (page_title, log_date, reported_by) already bound, so rows are complete
+# at construction.
 
-def _norm_page_title(data: dict, wcag: str, **ctx) -> list[ReportRow]:
-    rows = []
-    for issue in data.get("issues", []):
-        rows.append(ReportRow(
+RowFactory = Callable[..., ReportRow]
+
+# Shared by both row kinds emitted for the heading_structure prompt.
+_HEADINGS_ELEMENT = "<h1>-<h6>"
+_HEADINGS_CATEGORY = "Semantic Structure / Headings"
+
+
+def _join(issues: list[str]) -> str:
+    """Join an LLM ``issues`` list into one CSV cell."""
+    return "; ".join(issues)
+
+
+def _norm_page_title(data: dict, wcag: str, new_row: RowFactory) -> list[ReportRow]:
+    recommendation = _get_recommendation(data)
+    return [
+        new_row(
             element_name="<title>",
             issue_title=f"Page Title: {issue}",
             steps_to_reproduce="View the page in a browser and check the tab title, or inspect the <title> element in the HTML head",
             actual_result=issue,
             expected_result="Page title should be descriptive and match H1 content",
-            recommendation=_get_recommendation(data),
+            recommendation=recommendation,
             wcag_sc=wcag,
             category="Semantic Structure / Page Title",
             impact="Serious",
-        ))
-    return rows
+        )
+        for issue in data.get("issues", [])
+    ]
 
 
-def _norm_heading_structure(data: dict, wcag: str, **ctx) -> list[ReportRow]:
-    rows = []
-    for issue in data.get("issues", []):
-        rows.append(ReportRow(
-            element_name="<h1>-<h6>",
+def _norm_heading_structure(data: dict, wcag: str, new_row: RowFactory) -> list[ReportRow]:
+    return [
+        new_row(
+            element_name=_HEADINGS_ELEMENT,
             issue_title=f"Heading Structure: {issue}",
             steps_to_reproduce="Review the heading hierarchy of the page using browser developer tools or an accessibility tree viewer",
             actual_result=issue,
             expected_result="Headings should form a logical content outline",
             recommendation=issue,
             wcag_sc=wcag,
-            category="Semantic Structure / Headings",
+            category=_HEADINGS_CATEGORY,
             impact="Moderate",
-        ))
-    for heading in data.get("vague_headings", []):
-        rows.append(ReportRow(
-            element_name="<h1>-<h6>",
+        )
+        for issue in data.get("issues", [])
+    ] + [
+        new_row(
+            element_name=_HEADINGS_ELEMENT,
             issue_title=f"Vague heading: \"{heading}\"",
             steps_to_reproduce=f"Search the page for a heading with the text: \"{heading}\"",
             actual_result=f"Heading \"{heading}\" is vague or unclear",
             expected_result="Headings should meaningfully describe their sections",
             recommendation=f"Replace \"{heading}\" with a more descriptive heading",
             wcag_sc=wcag,
-            category="Semantic Structure / Headings",
+            category=_HEADINGS_CATEGORY,
             impact="Moderate",
-        ))
-    return rows
+        )
+        for heading in data.get("vague_headings", [])
+    ]
 
 
-def _norm_link_clarity(data: list, wcag: str, **ctx) -> list[ReportRow]:
+def _norm_link_clarity(data: list, wcag: str, new_row: RowFactory) -> list[ReportRow]:
     rows = []
+    append = rows.append
     for item in data:
         if item.get("is_clear", True):
             continue
         text = item.get("text") or "(no text)"
-        rows.append(ReportRow(
+        append(new_row(
             element_name=f"<a> \"{text}\"",
             issue_title=f"Unclear link: \"{text}\"",
             steps_to_reproduce=item.get("location_hint") or "",
@@ -620,13 +753,14 @@ def _norm_link_clarity(data: list, wcag: str, **ctx) -> list[ReportRow]:
     return rows
 
 
-def _norm_iframe_titles(data: list, wcag: str, **ctx) -> list[ReportRow]:
+def _norm_iframe_titles(data: list, wcag: str, new_row: RowFactory) -> list[ReportRow]:
     rows = []
+    append = rows.append
     for item in data:
         if item.get("is_descriptive", True):
             continue
         title = item.get("title") or "(no title)"
-        rows.append(ReportRow(
+        append(new_row(
             element_name=f"<iframe> \"{title}\"",
             issue_title=f"Non-descriptive iframe title: \"{title}\"",
             steps_to_reproduce=item.get("location_hint") or "",
@@ -640,10 +774,9 @@ def _norm_iframe_titles(data: list, wcag: str, **ctx) -> list[ReportRow]:
     return rows
 
 
-def _norm_landmark_structure(data: dict, wcag: str, **ctx) -> list[ReportRow]:
-    rows = []
-    for issue in data.get("issues", []):
-        rows.append(ReportRow(
+def _norm_landmark_structure(data: dict, wcag: str, new_row: RowFactory) -> list[ReportRow]:
+    return [
+        new_row(
             element_name="<main>/<nav>/<header>/<footer>",
             issue_title=f"Landmark issue: {issue}",
             steps_to_reproduce="Inspect the ARIA landmark regions of the page using an accessibility tool or browser extension",
@@ -653,24 +786,27 @@ def _norm_landmark_structure(data: dict, wcag: str, **ctx) -> list[ReportRow]:
             wcag_sc=wcag,
             category="Semantic Structure / Landmarks",
             impact="Minor",
-        ))
-    return rows
+        )
+        for issue in data.get("issues", [])
+    ]
 
 
-def _norm_label_quality(data: list, wcag: str, **ctx) -> list[ReportRow]:
+def _norm_label_quality(data: list, wcag: str, new_row: RowFactory) -> list[ReportRow]:
     rows = []
+    append = rows.append
     for item in data:
-        if item.get("is_descriptive", True):
+        g = item.get
+        if g("is_descriptive", True):
             continue
-        field_id = item.get("field_id") or "unknown"
-        field_type = item.get("field_type", "input")
-        label = item.get("effective_label") or "(no label)"
-        issues = item.get("issues", [])
-        rows.append(ReportRow(
+        field_id = g("field_id") or "unknown"
+        field_type = g("field_type", "input")
+        label = g("effective_label") or "(no label)"
+        issues = g("issues", [])
+        append(new_row(
             element_name=f"<{field_type} id=\"{field_id}\">",
             issue_title=f"Poor label quality: \"{label}\"",
-            steps_to_reproduce=item.get("location_hint") or "",
-            actual_result="; ".join(issues),
+            steps_to_reproduce=g("location_hint") or "",
+            actual_result=_join(issues),
             expected_result="Form field labels should be descriptive and meaningful",
             recommendation=_get_recommendation(item),
             wcag_sc=wcag,
@@ -680,19 +816,21 @@ def _norm_label_quality(data: list, wcag: str, **ctx) -> list[ReportRow]:
     return rows
 
 
-def _norm_required_field_indicators(data: list, wcag: str, **ctx) -> list[ReportRow]:
+def _norm_required_field_indicators(data: list, wcag: str, new_row: RowFactory) -> list[ReportRow]:
     rows = []
+    append = rows.append
     for item in data:
-        issues = item.get("issues", [])
+        g = item.get
+        issues = g("issues", [])
         if not issues:
             continue
-        field_id = item.get("field_id") or "unknown"
-        label = item.get("effective_label") or "(no label)"
-        rows.append(ReportRow(
+        field_id = g("field_id") or "unknown"
+        label = g("effective_label") or "(no label)"
+        append(new_row(
             element_name=f"<input id=\"{field_id}\">",
             issue_title=f"Required field not clearly indicated: \"{label}\"",
-            steps_to_reproduce=item.get("location_hint") or "",
-            actual_result="; ".join(issues),
+            steps_to_reproduce=g("location_hint") or "",
+            actual_result=_join(issues),
             expected_result="Required field status should be communicated visually and programmatically",
             recommendation=_get_recommendation(item),
             wcag_sc=wcag,
@@ -702,19 +840,21 @@ def _norm_required_field_indicators(data: list, wcag: str, **ctx) -> list[Report
     return rows
 
 
-def _norm_informative_alt_quality(data: list, wcag: str, **ctx) -> list[ReportRow]:
+def _norm_informative_alt_quality(data: list, wcag: str, new_row: RowFactory) -> list[ReportRow]:
     rows = []
+    append = rows.append
     for item in data:
-        issues = item.get("issues", [])
+        g = item.get
+        issues = g("issues", [])
         if not issues:
             continue
-        src = item.get("src", "")
-        alt = item.get("alt", "")
-        rows.append(ReportRow(
+        src = g("src", "")
+        alt = g("alt", "")
+        append(new_row(
             element_name=f"<img src=\"{src}\">",
-            issue_title=f"Poor alt text quality ({item.get('quality', 'poor')}): \"{alt}\"",
-            steps_to_reproduce=item.get("location_hint") or "",
-            actual_result="; ".join(issues),
+            issue_title=f"Poor alt text quality ({g('quality', 'poor')}): \"{alt}\"",
+            steps_to_reproduce=g("location_hint") or "",
+            actual_result=_join(issues),
             expected_result="Alt text should accurately and concisely describe image content",
             recommendation=_get_recommendation(item),
             wcag_sc=wcag,
@@ -724,13 +864,14 @@ def _norm_informative_alt_quality(data: list, wcag: str, **ctx) -> list[ReportRo
     return rows
 
 
-def _norm_decorative_verification(data: list, wcag: str, **ctx) -> list[ReportRow]:
+def _norm_decorative_verification(data: list, wcag: str, new_row: RowFactory) -> list[ReportRow]:
     rows = []
+    append = rows.append
     for item in data:
         if item.get("likely_decorative", True):
             continue
         src = item.get("src", "")
-        rows.append(ReportRow(
+        append(new_row(
             element_name=f"<img src=\"{src}\" alt=\"\">",
             issue_title=f"Possibly mis-marked as decorative: {src}",
             steps_to_reproduce=item.get("location_hint") or "",
@@ -744,20 +885,22 @@ def _norm_decorative_verification(data: list, wcag: str, **ctx) -> list[ReportRo
     return rows
 
 
-def _norm_actionable_image_alt(data: list, wcag: str, **ctx) -> list[ReportRow]:
+def _norm_actionable_image_alt(data: list, wcag: str, new_row: RowFactory) -> list[ReportRow]:
     rows = []
+    append = rows.append
     for item in data:
-        issues = item.get("issues", [])
+        g = item.get
+        issues = g("issues", [])
         if not issues:
             continue
-        src = item.get("src", "")
-        context = item.get("context", "in_link")
-        alt = item.get("alt") or "(empty)"
-        rows.append(ReportRow(
+        src = g("src", "")
+        context = g("context", "in_link")
+        alt = g("alt") or "(empty)"
+        append(new_row(
             element_name=f"<img src=\"{src}\"> ({context})",
             issue_title=f"Actionable image alt issue: \"{alt}\"",
-            steps_to_reproduce=item.get("location_hint") or "",
-            actual_result="; ".join(issues),
+            steps_to_reproduce=g("location_hint") or "",
+            actual_result=_join(issues),
             expected_result="Images in links/buttons should describe the action/destination, not appearance",
             recommendation=_get_recommendation(item),
             wcag_sc=wcag,
@@ -767,18 +910,20 @@ def _norm_actionable_image_alt(data: list, wcag: str, **ctx) -> list[ReportRow]:
     return rows
 
 
-def _norm_svg_accessibility(data: list, wcag: str, **ctx) -> list[ReportRow]:
+def _norm_svg_accessibility(data: list, wcag: str, new_row: RowFactory) -> list[ReportRow]:
     rows = []
+    append = rows.append
     for item in data:
-        issues = item.get("issues", [])
+        g = item.get
+        issues = g("issues", [])
         if not issues:
             continue
-        label = item.get("aria_label") or item.get("title") or "(unlabeled)"
-        rows.append(ReportRow(
+        label = g("aria_label") or g("title") or "(unlabeled)"
+        append(new_row(
             element_name=f"<svg> \"{label}\"",
             issue_title=f"SVG accessibility issue: {label}",
-            steps_to_reproduce=item.get("location_hint") or "",
-            actual_result="; ".join(issues),
+            steps_to_reproduce=g("location_hint") or "",
+            actual_result=_join(issues),
             expected_result="SVGs should have role=\"img\" and an accessible name via title + aria-labelledby",
             recommendation=_get_recommendation(item),
             wcag_sc=wcag,
@@ -788,19 +933,21 @@ def _norm_svg_accessibility(data: list, wcag: str, **ctx) -> list[ReportRow]:
     return rows
 
 
-def _norm_icon_font_accessibility(data: list, wcag: str, **ctx) -> list[ReportRow]:
+def _norm_icon_font_accessibility(data: list, wcag: str, new_row: RowFactory) -> list[ReportRow]:
     rows = []
+    append = rows.append
     for item in data:
-        issues = item.get("issues", [])
+        g = item.get
+        issues = g("issues", [])
         if not issues:
             continue
-        classes = item.get("classes", "")
-        pattern = item.get("pattern", "")
-        rows.append(ReportRow(
+        classes = g("classes", "")
+        pattern = g("pattern", "")
+        append(new_row(
             element_name=f"<i class=\"{classes}\">",
             issue_title=f"Icon font issue ({pattern}): {classes}",
-            steps_to_reproduce=item.get("location_hint") or "",
-            actual_result="; ".join(issues),
+            steps_to_reproduce=g("location_hint") or "",
+            actual_result=_join(issues),
             expected_result="Icon fonts should be properly labeled or hidden from assistive technology",
             recommendation=_get_recommendation(item),
             wcag_sc=wcag,
@@ -812,7 +959,8 @@ def _norm_icon_font_accessibility(data: list, wcag: str, **ctx) -> list[ReportRo
 
 # ── Normalizer registry ────────────────────────────────────────────────────
 
-NORMALIZERS: dict[str, callable] = {
+# Each normalizer takes (parsed_response, wcag_str, new_row) positionally.
+NORMALIZERS: dict[str, Callable[[Any, str, RowFactory], list[ReportRow]]] = {
     "page_title": _norm_page_title,
     "heading_structure": _norm_heading_structure,
     "link_clarity": _norm_link_clarity,
@@ -910,6 +1058,49 @@ def deduplicate_with_llm(
 
 # ── Main report generation ─────────────────────────────────────────────────
 
+def _numbered(rows: Iterable[ReportRow]) -> Iterator[ReportRow]:
+    """Yield *rows* with sequential 1-based IDs assigned as they stream past."""
+    for i, row in enumerate(rows, start=1):
+        row.ID = i
+        yield row
+
+
+def _load_prompt_result(
+    prompt_entry: dict,
+    prompt_files: dict[str, str],
+) -> tuple[object | None, str | None]:
+    """Load one executed prompt's output file and parse its LLM response.
+
+    Safe to run on a worker thread: it only reads files and returns values,
+    leaving printing and normalization to the caller.
+
+    Returns:
+        ``(parsed, warning)`` — *parsed* is None when the prompt has no
+        normalizer, no output file, or a failed API call; *warning* is set
+        when the response could not be parsed as JSON.
+    """
+    name = prompt_entry["name"]
+    if name not in NORMALIZERS:
+        return None, None
+    # The manifest already records failed calls; don't read their files.
+    if prompt_entry.get("status") == "error":
+        return None, None
+
+    prompt_data = load_prompt_file(prompt_files.get(name))
+    if prompt_data is None:
+        return None, None
+
+    api_result = prompt_data.get("api_result", {})
+    if not api_result.get("success", False):
+        return None, None
+
+    response_text = api_result.get("response", "")
+    try:
+        return safe_parse_json(response_text), None
+    except (json.JSONDecodeError, ValueError):
+        return None, f"  WARNING: Could not parse JSON response for {name}, skipping"
+
+
 def generate_report(
     output_dir: Path,
     report_dir: Path,
@@ -932,15 +1123,15 @@ def generate_report(
     """
     # 1. Load manifest
     manifest_path = output_dir / "manifest.json"
-    with open(manifest_path, encoding="utf-8") as f:
-        manifest = json.load(f)
+    manifest = _loads(manifest_path.read_bytes())
 
     run_timestamp = manifest.get("run_timestamp", "")
     log_date = run_timestamp[:10] if run_timestamp else "unknown"
     manifest_model = manifest.get("model", "unknown")
 
     # 2. Extract page title from page_title prompt payload
-    page_title_data = load_prompt_file(output_dir / "prompts" / "page_title.json")
+    prompt_files = _scan_prompt_files(output_dir / "prompts")
+    page_title_data = load_prompt_file(prompt_files.get("page_title"))
     page_title = ""
     if page_title_data:
         page_title = extract_page_title_from_payload(page_title_data)
@@ -952,55 +1143,43 @@ def generate_report(
     prog_path = output_dir / "programmatic_findings.json"
     prog_findings = []
     if prog_path.exists():
-        with open(prog_path, encoding="utf-8") as f:
-            prog_raw = json.load(f)
+        prog_raw = _loads(prog_path.read_bytes())
         prog_findings = normalize_programmatic(prog_raw, page_title, log_date)
 
     # 4. Normalize LLM prompt results
     llm_findings: list[ReportRow] = []
-    prompts_dir = output_dir / "prompts"
-
-    for prompt_entry in manifest.get("prompts_executed", []):
-        name = prompt_entry["name"]
-        wcag_list = prompt_entry.get("wcag_criteria", [])
-        wcag_str = ", ".join(wcag_list)
-
-        normalizer = NORMALIZERS.get(name)
-        if normalizer is None:
-            continue
 
-        prompt_file = prompts_dir / f"{name}.json"
-        prompt_data = load_prompt_file(prompt_file)
-        if prompt_data is None:
-            continue
-
-        api_result = prompt_data.get("api_result", {})
-        if not api_result.get("success", False):
+    # File reads and JSON parsing are independent per prompt, so overlap them
+    # on a thread pool; normalization then runs here in manifest order.
+    prompt_entries = manifest.get("prompts_executed", [])
+    new_row = partial(
+        ReportRow,
+        page_title=page_title,
+        log_date=log_date,
+        reported_by=manifest_model,
+    )
+    load_one = partial(_load_prompt_result, prompt_files=prompt_files)
+    max_workers = max(1, min(12, os.cpu_count() or 1, len(prompt_entries)))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        loaded = list(pool.map(load_one, prompt_entries))
+
+    for prompt_entry, (parsed, warning) in zip(prompt_entries, loaded):
+        if warning:
+            print(warning)
             continue
-
-        response_text = api_result.get("response", "")
-        try:
-            parsed = safe_parse_json(response_text)
-        except (json.JSONDecodeError, ValueError):
-            print(f"  WARNING: Could not parse JSON response for {name}, skipping")
+        if parsed is None:
             continue
 
-        new_rows = normalizer(parsed, wcag=wcag_str)
-
-        # Fill in shared fields
-        for row in new_rows:
-            row.page_title = page_title
-            row.log_date = log_date
-            row.reported_by = manifest_model
-
-        llm_findings.extend(new_rows)
+        name = prompt_entry["name"]
+        wcag_list = prompt_entry.get("wcag_criteria", [])
+        wcag_str = ", ".join(wcag_list)
+        normalizer = NORMALIZERS[name]
 
-    # 5. Combine all findings
-    all_rows = prog_findings + llm_findings
+        llm_findings.extend(normalizer(parsed, wcag_str, new_row))
 
-    # 6. Filter false positives using the source HTML
+    # 5. Filter false positives using the source HTML
     soup = _load_html_for_filtering(output_dir)
-    kept, suppressed = filter_false_positives(all_rows, soup)
+    kept, suppressed = filter_false_positives(chain(prog_findings, llm_findings), soup)
 
     if suppressed:
         print(f"  False positives suppressed: {len(suppressed)}")
@@ -1011,26 +1190,24 @@ def generate_report(
         for cat, count in sorted(fp_cats.items(), key=lambda x: -x[1]):
             print(f"    {cat}: {count}")
 
-    # 6b. LLM deduplication pass (optional — skipped when no api_key provided)
+    # 6. LLM deduplication pass (optional — skipped when no api_key provided)
     dedup_model = model or manifest_model
     if api_key and dedup_model:
         kept = deduplicate_with_llm(kept, api_key, dedup_model)
 
-    # 7. Assign sequential IDs
-    for i, row in enumerate(kept, start=1):
-        row.ID = i
-
-    # 8. Write CSV
+    # 7. Write CSV, assigning sequential IDs on the way out
     report_dir.mkdir(parents=True, exist_ok=True)
     report_path = report_dir / f"report_{log_date}.csv"
 
-    with open(report_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS)
-        writer.writeheader()
-        for row in kept:
-            writer.writerow({col: getattr(row, col) for col in CSV_COLUMNS})
+    buf = io.BytesIO()
+    write = buf.write
+    write(_csv_line(CSV_COLUMNS))
+    for row in _numbered(kept):
+        write(_csv_line(_ROW_GETTER(row)))
+    with open(report_path, "wb") as f:
+        f.write(buf.getvalue())
 
-    # 9. Print summary
+    # 8. Print summary
     print(f"Report generated: {report_path}")
     print(f"  Programmatic findings: {len(prog_findings)}")
     print(f"  LLM findings:         {len(llm_findings)}")
@@ -1075,7 +1252,6 @@ def main():
     args = parser.parse_args()
 
     # Resolve API key from env if not passed explicitly
-    import os
     api_key = args.api_key or os.getenv("ANTHROPIC_API_KEY") or os.getenv("OPENAI_API_KEY")
 
     generate_report(args.output_dir, args.report_dir, api_key=api_key, model=args.model)
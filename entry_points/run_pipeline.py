@@ -15,6 +15,9 @@ Usage:
 """
 
 import argparse
+import asyncio
+import hashlib
+import io
 import json
 import os
 import sys
@@ -22,23 +25,26 @@ import time
 from datetime import datetime, timezone
 from pathlib import Path
 
+from bs4 import BeautifulSoup
 from dotenv import load_dotenv
 
+
 # Ensure project root is on sys.path so we can import processing_scripts/
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from processing_scripts.json_bytes import dumps_bytes
 from processing_scripts.llm.registry import PROMPT_REGISTRY, PromptSpec
 from processing_scripts.llm.slicers import get_slicer, is_empty_slice
 from processing_scripts.llm.templates import fill_template
 from processing_scripts.llm_preprocessing.semantic_checklist_01 import (
-    extract as cl01_extract,
+    extract_from_soup as cl01_extract,
 )
 from processing_scripts.llm_preprocessing.forms_checklist_02 import (
-    extract as cl02_extract,
+    extract_from_soup as cl02_extract,
 )
 from processing_scripts.llm_preprocessing.nontext_checklist_03 import (
-    extract as cl03_extract,
+    extract_from_soup as cl03_extract,
 )
 from processing_scripts.llm.filters import (
     apply_cl01_filters,
@@ -49,6 +55,7 @@ from processing_scripts.llm.filters import (
 from processing_scripts.programmatic.semantic_checklist_01 import audit_html_file
 from processing_scripts.programmatic.forms_checklist_02 import audit_forms
 from processing_scripts.programmatic.nontext_checklist_03 import audit_nontext
+from vision_aid.ingestion.pull_html import read_html
 
 
 # Pricing per million tokens: (input, output)
@@ -69,31 +76,62 @@ MODEL_PRICING = {
 }
 
 
+# Default cap on LLM requests in flight at once during a live run.
+DEFAULT_MAX_CONCURRENCY = 8
+
+# SDK-level retries (with exponential backoff) for 429s, 5xx and dropped
+# connections, so one transient failure does not lose a prompt.
+DEFAULT_MAX_RETRIES = 5
+
+# Anthropic and OpenAI bill Batch API requests at half the normal rate.
+# Batches finish within 24 hours; their status is checked this often.
+BATCH_API_DISCOUNT = 0.5
+BATCH_POLL_SECONDS = 30.0
+
+
+# Longest prefix first, so gpt-4o-mini is not priced as gpt-4o
+_PRICING_PREFIXES = tuple(sorted(MODEL_PRICING, key=len, reverse=True))
+
+
 def get_pricing(model: str) -> tuple[float, float] | None:
     """Look up per-million-token pricing for a model.
 
-    Matches on model prefix so dated model IDs (e.g.
-    claude-sonnet-4-20250514) resolve correctly.
+    Matches on the longest model prefix so dated model IDs (e.g.
+    claude-sonnet-4-20250514) and "-mini" variants resolve correctly.
     Returns (input_cost, output_cost) or None if unknown.
     """
-    for prefix, pricing in MODEL_PRICING.items():
+    for prefix in _PRICING_PREFIXES:
         if model.startswith(prefix):
-            return pricing
+            return MODEL_PRICING[prefix]
     return None
 
 
-def compute_cost(input_tokens: int, output_tokens: int, model: str) -> float | None:
-    """Return the estimated dollar cost for a run, or None if pricing is unknown."""
+def compute_cost(
+    input_tokens: int,
+    output_tokens: int,
+    model: str,
+    batch: bool = False,
+) -> float | None:
+    """Return the estimated dollar cost for a run, or None if pricing is unknown.
+
+    *batch* applies the providers' Batch API discount.
+    """
     pricing = get_pricing(model)
     if pricing is None:
         return None
     input_cost, output_cost = pricing
-    return (input_tokens * input_cost + output_tokens * output_cost) / 1_000_000
+    cost = (input_tokens * input_cost + output_tokens * output_cost) / 1_000_000
+    return cost * BATCH_API_DISCOUNT if batch else cost
+
+
+def estimate_tokens_bytes(n_bytes: int) -> int:
+    """Rough token estimate from a byte count (~4 bytes per token)."""
+    return max(1, n_bytes // 4)
 
 
 def estimate_tokens(text: str) -> int:
     """Rough token estimate (~4 chars per token for English/HTML)."""
-    return max(1, len(text) // 4)
+    return estimate_tokens_bytes(len(text))
 
 
 class PipelineClient:
@@ -102,21 +140,46 @@ class PipelineClient:
     Detects the provider from the model ID and uses the appropriate SDK.
     Returns the same dict shape regardless of provider so downstream code
     (``generate_report.py``, etc.) works unchanged.
+
+    ``call`` is blocking; ``acall`` is its asyncio counterpart, backed by the
+    SDK's async client, which is created on first use and released by
+    ``aclose`` once the event loop that used it is done. Each SDK client is
+    built once and reused, so its connection pool is shared by every call;
+    the SDK retries rate-limit (429), overload and 5xx responses and
+    connection errors with exponential backoff, up to *max_retries* times.
     """
 
-    def __init__(self, api_key: str, model: str, max_tokens: int = 8192):
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        max_tokens: int = 8192,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ):
         from processing_scripts.llm_client.client import is_openai_model
 
         self.model = model
         self.max_tokens = max_tokens
+        self.max_retries = max_retries
         self._is_openai = is_openai_model(model)
+        self._api_key = api_key
+        self._client = None
+        self._async_client = None
 
-        if self._is_openai:
-            import openai
-            self._client = openai.OpenAI(api_key=api_key)
-        else:
-            import anthropic
-            self._client = anthropic.Anthropic(api_key=api_key)
+    def _get_client(self):
+        """Return the blocking SDK client, creating it on first use."""
+        if self._client is None:
+            if self._is_openai:
+                import openai
+                self._client = openai.OpenAI(
+                    api_key=self._api_key, max_retries=self.max_retries
+                )
+            else:
+                import anthropic
+                self._client = anthropic.Anthropic(
+                    api_key=self._api_key, max_retries=self.max_retries
+                )
+        return self._client
 
     def call(self, prompt: str) -> dict:
         """Send *prompt* to the API and return a result dict.
@@ -131,21 +194,201 @@ class PipelineClient:
                 return self._call_openai(prompt, start)
             return self._call_anthropic(prompt, start)
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "duration_seconds": round(time.time() - start, 2),
-            }
+            return self._error_result(e, start)
+
+    async def acall(self, prompt: str) -> dict:
+        """Async version of :meth:`call`; returns the same result dict."""
+        start = time.time()
+
+        try:
+            if self._is_openai:
+                return await self._acall_openai(prompt, start)
+            return await self._acall_anthropic(prompt, start)
+        except Exception as e:
+            return self._error_result(e, start)
+
+    async def aclose(self) -> None:
+        """Close the async SDK client, if one was created."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
+    def _get_async_client(self):
+        """Return the async SDK client, creating it on first use."""
+        if self._async_client is None:
+            if self._is_openai:
+                import openai
+                self._async_client = openai.AsyncOpenAI(
+                    api_key=self._api_key, max_retries=self.max_retries
+                )
+            else:
+                import anthropic
+                self._async_client = anthropic.AsyncAnthropic(
+                    api_key=self._api_key, max_retries=self.max_retries
+                )
+        return self._async_client
+
+    def _request_kwargs(self, prompt: str) -> dict:
+        """Build the request arguments shared by both providers."""
+        return {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "temperature": 0.1,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
+    def call_batch(
+        self,
+        prompts: list[str],
+        poll_seconds: float = BATCH_POLL_SECONDS,
+    ) -> list[dict]:
+        """Send *prompts* as one provider Batch API job and wait for it to end.
+
+        Blocks, checking every *poll_seconds*, until the provider finishes
+        the batch (up to 24 hours). Returns one result dict per prompt, in
+        order, shaped like :meth:`call`'s; ``duration_seconds`` covers the
+        whole batch.
+        """
+        start = time.time()
+        custom_ids = [f"call-{i}" for i in range(len(prompts))]
+
+        try:
+            if self._is_openai:
+                results = self._batch_openai(custom_ids, prompts, start, poll_seconds)
+            else:
+                results = self._batch_anthropic(custom_ids, prompts, start, poll_seconds)
+        except Exception as e:
+            return [self._error_result(e, start) for _ in prompts]
+
+        return [
+            results.get(cid)
+            or self._error_result("no result for this request in the batch output", start)
+            for cid in custom_ids
+        ]
+
+    def _batch_anthropic(
+        self,
+        custom_ids: list[str],
+        prompts: list[str],
+        start: float,
+        poll_seconds: float,
+    ) -> dict[str, dict]:
+        """Run a Message Batches job and return results keyed by custom ID."""
+        batches = self._get_client().messages.batches
+        batch = batches.create(requests=[
+            {"custom_id": cid, "params": self._request_kwargs(prompt)}
+            for cid, prompt in zip(custom_ids, prompts)
+        ])
+        print(f"  Batch {batch.id} submitted; checking every {poll_seconds:g}s...", flush=True)
+        while batch.processing_status != "ended":
+            time.sleep(poll_seconds)
+            batch = batches.retrieve(batch.id)
+
+        results = {}
+        for entry in batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                results[entry.custom_id] = self._anthropic_result(entry.result.message, start)
+            elif entry.result.type == "errored":
+                results[entry.custom_id] = self._error_result(entry.result.error.error.message, start)
+            else:
+                results[entry.custom_id] = self._error_result(
+                    f"batch request {entry.result.type}", start
+                )
+        return results
+
+    def _batch_openai(
+        self,
+        custom_ids: list[str],
+        prompts: list[str],
+        start: float,
+        poll_seconds: float,
+    ) -> dict[str, dict]:
+        """Run a Chat Completions batch job and return results keyed by custom ID."""
+        from openai.types.chat import ChatCompletion
+
+        client = self._get_client()
+        lines = "\n".join(
+            json.dumps({
+                "custom_id": cid,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._request_kwargs(prompt),
+            }, ensure_ascii=False)
+            for cid, prompt in zip(custom_ids, prompts)
+        )
+        input_file = client.files.create(
+            file=("batch.jsonl", lines.encode("utf-8")), purpose="batch"
+        )
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        print(f"  Batch {batch.id} submitted; checking every {poll_seconds:g}s...", flush=True)
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_seconds)
+            batch = client.batches.retrieve(batch.id)
+
+        # Expired or cancelled batches still return the requests that finished
+        results = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in client.files.content(file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                response = entry.get("response") or {}
+                if response.get("status_code") == 200:
+                    completion = ChatCompletion.model_validate(response["body"])
+                    results[entry["custom_id"]] = self._openai_result(completion, start)
+                else:
+                    error = entry.get("error") or (response.get("body") or {}).get("error") or {}
+                    results[entry["custom_id"]] = self._error_result(
+                        error.get("message") or f"HTTP {response.get('status_code')}", start
+                    )
+        if not results and batch.status != "completed":
+            raise RuntimeError(f"batch {batch.id} {batch.status}")
+        return results
+
+    @staticmethod
+    def _error_result(error: Exception | str, start: float) -> dict:
+        """Build the result dict for a failed call."""
+        return {
+            "success": False,
+            "error": str(error),
+            "duration_seconds": round(time.time() - start, 2),
+        }
 
     def _call_anthropic(self, prompt: str, start: float) -> dict:
         """Call the Anthropic Messages API."""
-        message = self._client.messages.create(
-            model=self.model,
-            max_tokens=self.max_tokens,
-            temperature=0.1,
-            messages=[{"role": "user", "content": prompt}],
-        )
+        message = self._get_client().messages.create(**self._request_kwargs(prompt))
+        return self._anthropic_result(message, start)
+
+    async def _acall_anthropic(self, prompt: str, start: float) -> dict:
+        """Stream a reply from the Anthropic Messages API.
 
+        Streaming starts the response as soon as the first tokens are ready
+        instead of waiting for the whole message; the time to that first
+        token is recorded as ``first_token_seconds``.
+        """
+        first_token_at = None
+        async with self._get_async_client().messages.stream(
+            **self._request_kwargs(prompt)
+        ) as stream:
+            async for _ in stream.text_stream:
+                if first_token_at is None:
+                    first_token_at = time.time()
+            message = await stream.get_final_message()
+
+        result = self._anthropic_result(message, start)
+        if first_token_at is not None:
+            result["first_token_seconds"] = round(first_token_at - start, 2)
+        return result
+
+    @staticmethod
+    def _anthropic_result(message, start: float) -> dict:
+        """Convert an Anthropic message into the pipeline result dict."""
         response_text = "".join(
             block.text for block in message.content if block.type == "text"
         )
@@ -164,13 +407,19 @@ class PipelineClient:
 
     def _call_openai(self, prompt: str, start: float) -> dict:
         """Call the OpenAI Chat Completions API."""
-        response = self._client.chat.completions.create(
-            model=self.model,
-            max_tokens=self.max_tokens,
-            temperature=0.1,
-            messages=[{"role": "user", "content": prompt}],
+        response = self._get_client().chat.completions.create(**self._request_kwargs(prompt))
+        return self._openai_result(response, start)
+
+    async def _acall_openai(self, prompt: str, start: float) -> dict:
+        """Call the OpenAI Chat Completions API without blocking the event loop."""
+        response = await self._get_async_client().chat.completions.create(
+            **self._request_kwargs(prompt)
         )
+        return self._openai_result(response, start)
 
+    @staticmethod
+    def _openai_result(response, start: float) -> dict:
+        """Convert an OpenAI chat completion into the pipeline result dict."""
         return {
             "success": True,
             "response": response.choices[0].message.content,
@@ -184,10 +433,269 @@ class PipelineClient:
         }
 
 
-def save_json(obj: object, path: Path) -> None:
-    """Write an object as formatted JSON to a file."""
+class _TokenBucket:
+    """Async token bucket holding up to *per_minute* units, refilled evenly.
+
+    Starts full, like a provider's per-minute quota, so a short burst goes
+    out at once and later acquires are paced to the refill rate.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = per_minute
+        self.level = per_minute
+        self.rate = per_minute / 60.0
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """Wait until *amount* units are available, then take them.
+
+        Requests larger than the whole bucket wait for a full bucket.
+        Waiters are served in arrival order.
+        """
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.level >= amount:
+                    self.level -= amount
+                    return
+                await asyncio.sleep((amount - self.level) / self.rate)
+
+
+async def _call_prompts(
+    client: PipelineClient,
+    calls: list[tuple[str, str, int]],
+    max_concurrency: int,
+    on_result,
+    requests_per_minute: float | None = None,
+    tokens_per_minute: float | None = None,
+) -> None:
+    """Send every ``(label, prompt_text, tokens_est)`` call concurrently.
+
+    At most *max_concurrency* requests are in flight at once. With
+    *requests_per_minute* or *tokens_per_minute* (estimated input tokens),
+    calls are also paced to stay under the provider's rate limits instead
+    of running into 429s and backoff.
+    ``on_result(index, api_result, log)`` runs on the event loop as each call
+    finishes, so results arrive in completion order, not call order.
+
+    Each call's console lines go to its own *log* buffer and are written out
+    together when it finishes, so concurrent calls never interleave.
+    """
+    sem = asyncio.Semaphore(max_concurrency)
+    request_bucket = _TokenBucket(requests_per_minute) if requests_per_minute else None
+    token_bucket = _TokenBucket(tokens_per_minute) if tokens_per_minute else None
+
+    async def run_one(index: int, label: str, prompt_text: str, tokens_est: int) -> None:
+        log = io.StringIO()
+        async with sem:
+            if request_bucket:
+                await request_bucket.acquire()
+            if token_bucket:
+                await token_bucket.acquire(tokens_est)
+            print(f"  [{label}] Calling {client.model} (~{tokens_est:,} tokens)...", file=log)
+            api_result = await client.acall(prompt_text)
+        on_result(index, api_result, log)
+        sys.stdout.write(log.getvalue())
+        sys.stdout.flush()
+
+    try:
+        await asyncio.gather(*(run_one(i, *call) for i, call in enumerate(calls)))
+    finally:
+        await client.aclose()
+
+
+# ── Prompt batching ─────────────────────────────────────────────────────────
+
+_BATCH_HEADER = (
+    "You will complete {count} independent accessibility evaluation tasks. "
+    "Each task starts with a line \"### PROMPT <name>\" and has its own "
+    "instructions and data; evaluate each one exactly as its instructions say.\n\n"
+)
+
+_BATCH_FOOTER = (
+    "\n\nReturn a single JSON object of the form "
+    "{{\"results\": {{\"<name>\": <that task's JSON answer>, ...}}}} "
+    "with exactly one entry for each of: {names}. "
+    "Return only that JSON object."
+)
+
+
+def _group_batches(specs: list[PromptSpec], batch_size: int) -> list[list[int]]:
+    """Group prompt indexes into batches of up to *batch_size*.
+
+    Only prompts from the same checklist share a batch, so each batched call
+    still works from a single extractor payload. Batches keep registry order.
+    """
+    if batch_size <= 1:
+        return [[i] for i in range(len(specs))]
+
+    open_batches: dict[str, list[int]] = {}
+    batches: list[list[int]] = []
+    for i, spec in enumerate(specs):
+        batch = open_batches.get(spec.checklist)
+        if batch is None or len(batch) >= batch_size:
+            batch = open_batches[spec.checklist] = []
+            batches.append(batch)
+        batch.append(i)
+    return batches
+
+
+def build_batch_prompt(names: list[str], prompt_texts: list[str]) -> str:
+    """Combine several filled prompts into one request keyed by prompt name."""
+    sections = [
+        f"### PROMPT {name}\n{text}" for name, text in zip(names, prompt_texts)
+    ]
+    return (
+        _BATCH_HEADER.format(count=len(names))
+        + "\n\n".join(sections)
+        + _BATCH_FOOTER.format(names=", ".join(names))
+    )
+
+
+def _split_usage(total: int, weights: list[int]) -> list[int]:
+    """Split *total* tokens across members in proportion to *weights*."""
+    weight_sum = sum(weights) or 1
+    shares = [total * w // weight_sum for w in weights]
+    shares[-1] += total - sum(shares)
+    return shares
+
+
+def split_batch_result(
+    api_result: dict,
+    names: list[str],
+    weights: list[int],
+) -> list[dict]:
+    """Fan one batched API result out into per-prompt result dicts.
+
+    Each successful member gets its own answer re-serialized as ``response``,
+    so prompt files look the same as for an unbatched call. Token usage is
+    shared out in proportion to *weights* (the members' prompt lengths). A
+    failed call, an unparseable response, or a missing answer marks the
+    affected members as failed.
+    """
+    batch_info = {"prompts": names}
+    if not api_result["success"]:
+        return [{**api_result, "batch": batch_info} for _ in names]
+
+    from entry_points.generate_report import safe_parse_json
+
+    try:
+        answers = safe_parse_json(api_result["response"])["results"]
+    except (json.JSONDecodeError, ValueError, KeyError, TypeError):
+        answers = {}
+    if not isinstance(answers, dict):
+        answers = {}
+
+    usage = api_result["usage"]
+    in_shares = _split_usage(usage["input_tokens"], weights)
+    out_shares = _split_usage(usage["output_tokens"], weights)
+    batch_info["usage"] = usage
+
+    member_results = []
+    for name, in_tok, out_tok in zip(names, in_shares, out_shares):
+        if name not in answers:
+            member_results.append({
+                "success": False,
+                "error": f"batched response has no result for {name}",
+                "response": api_result["response"],
+                "usage": {"input_tokens": in_tok, "output_tokens": out_tok},
+                "duration_seconds": api_result["duration_seconds"],
+                "batch": batch_info,
+            })
+            continue
+        member_results.append({
+            **api_result,
+            "response": json.dumps(answers[name], ensure_ascii=False),
+            "usage": {"input_tokens": in_tok, "output_tokens": out_tok},
+            "batch": batch_info,
+        })
+    return member_results
+
+
+# ── Prompt response cache ───────────────────────────────────────────────────
+
+def _prompt_key(model: str, max_tokens: int, prompt_text: str) -> str:
+    """Key a request by model, output limit and a 128-bit BLAKE2b hash of its text.
+
+    *max_tokens* is part of the key because a lower limit can truncate the
+    reply, so responses are only reused for identical requests.
+    """
+    digest = hashlib.blake2b(prompt_text.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{model}:{max_tokens}:{digest}"
+
+
+# Stop reasons of complete replies; one cut off by max_tokens is never cached
+_COMPLETE_STOPS = ("end_turn", "stop")
+
+
+def _cache_entry(api_result: dict) -> dict | None:
+    """Return the prompt cache entry for *api_result*, or None if it can't be cached.
+
+    Only successful, complete replies are kept. Usage and timings belong to
+    the call that produced them (for a batch member, the whole batch), so
+    they are zeroed or dropped and a replay never counts them again.
+    """
+    if not api_result.get("success") or api_result.get("stop_reason") not in _COMPLETE_STOPS:
+        return None
+    entry = {
+        key: value for key, value in api_result.items()
+        if key not in ("first_token_seconds", "batch")
+    }
+    entry["usage"] = {"input_tokens": 0, "output_tokens": 0}
+    entry["duration_seconds"] = 0.0
+    return entry
+
+
+def load_prompt_cache(path: Path) -> dict[str, dict]:
+    """Read the persistent prompt cache; a missing or corrupt file is empty.
+
+    Entries are passed through :func:`_cache_entry`, so ones written by
+    older versions lose their usage and timings, and truncated replies
+    are dropped.
+    """
+    try:
+        cache = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    entries = {}
+    for key, api_result in cache.items():
+        entry = _cache_entry(api_result) if isinstance(api_result, dict) else None
+        if entry is not None:
+            entries[key] = entry
+    return entries
+
+
+def _reused_result(api_result: dict) -> dict:
+    """Copy *api_result* for a prompt that did not make its own API call.
+
+    Usage is zeroed so run totals and cost only count tokens actually spent.
+    """
+    reused = {**api_result, "cached": True}
+    if "usage" in reused:
+        reused["usage"] = {"input_tokens": 0, "output_tokens": 0}
+    return reused
+
+
+def save_json(obj: object, path: Path) -> int:
+    """Write an object as compact JSON in a single write; return its size in bytes.
+
+    Used for the bulky machine-read outputs (findings, payloads, prompt
+    files); see :func:`save_json_pretty` for files meant to be read by eye.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path.write_bytes(dumps_bytes(obj))
+
+
+def save_json_pretty(obj: object, path: Path) -> None:
+    """Write an object as indented JSON to a file."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(obj, indent=2, ensure_ascii=False), encoding="utf-8")
+    path.write_bytes(dumps_bytes(obj, pretty=True))
 
 
 def run_pipeline(
@@ -198,9 +706,37 @@ def run_pipeline(
     dry_run: bool,
     include_summaries: bool,
     progress_callback=None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    batch_size: int = 1,
+    prompt_cache: bool = True,
+    batch_api: bool = False,
+    inline_prompts: bool = False,
+    requests_per_minute: float | None = None,
+    tokens_per_minute: float | None = None,
 ) -> dict:
     """Execute the full element-specific accessibility audit pipeline.
 
+    In a live run the LLM calls are sent concurrently, with at most
+    *max_concurrency* in flight at once and, when given, no more than
+    *requests_per_minute* calls or *tokens_per_minute* estimated input
+    tokens per minute. With *batch_size* above 1, up to
+    that many prompts from the same checklist share one API call.
+
+    Identical filled prompts are sent once per run. Successful responses
+    are kept in ``output_dir/.prompt_cache.json`` per model, and with
+    *prompt_cache* later runs reuse them instead of calling the API. Without
+    it every prompt is sent and fresh responses replace the stored ones. The
+    file only keeps the prompts of the latest run.
+
+    With *batch_api*, live calls go to the provider as one Batch API job at
+    about half the price; the run then waits until the job ends, which can
+    take up to 24 hours.
+
+    Live prompt files point at their template (``prompt_file`` and
+    ``prompt_index``) next to ``payload_slice`` rather than repeating the
+    filled prompt, which already contains the payload. *inline_prompts*
+    stores the full ``prompt_text`` as well.
+
     Returns a summary dict with run metadata and per-prompt results.
     """
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -226,24 +762,26 @@ def run_pipeline(
 
     # ── Step 1: Extract structured payloads ──────────────────────────────────
     print("Step 1: Extracting structured payloads...")
-    cl01_payload = cl01_extract(html_path_str)
-    cl02_payload = cl02_extract(html_path_str)
-    cl03_payload = cl03_extract(html_path_str)
+    # Parse once; the extractors only read the tree
+    soup = BeautifulSoup(read_html(html_path_str), "lxml")
+    cl01_payload = cl01_extract(soup)
+    cl02_payload = cl02_extract(soup)
+    cl03_payload = cl03_extract(soup)
+    del soup
 
     payloads = {"CL01": cl01_payload, "CL02": cl02_payload, "CL03": cl03_payload}
 
-    # Save payloads for inspection
+    # Save payloads for inspection, sizing each from the bytes written. This
+    # is the raw extractor output; the slices sent in prompts are indented,
+    # and Step 2's per-prompt estimates measure those.
+    payload_tokens = {}
     for name, payload in payloads.items():
         payload_path = output_dir / "payloads" / f"{name.lower()}_payload.json"
-        save_json(payload, payload_path)
-
-    cl01_tokens = estimate_tokens(json.dumps(cl01_payload))
-    cl02_tokens = estimate_tokens(json.dumps(cl02_payload))
-    cl03_tokens = estimate_tokens(json.dumps(cl03_payload))
+        payload_tokens[name] = estimate_tokens_bytes(save_json(payload, payload_path))
     print(
-        f"  CL01: ~{cl01_tokens:,} tokens | "
-        f"CL02: ~{cl02_tokens:,} tokens | "
-        f"CL03: ~{cl03_tokens:,} tokens"
+        f"  CL01: ~{payload_tokens['CL01']:,} tokens | "
+        f"CL02: ~{payload_tokens['CL02']:,} tokens | "
+        f"CL03: ~{payload_tokens['CL03']:,} tokens"
     )
 
     # ── Step 1.5: Apply Pass 1 filters ───────────────────────────────────────
@@ -286,6 +824,15 @@ def run_pipeline(
     if not dry_run:
         client = PipelineClient(api_key=api_key, model=model)
 
+    prompt_dir = output_dir / "prompts"
+    prompt_dir.mkdir(parents=True, exist_ok=True)
+
+    # Live calls are collected here and sent together once every prompt is built
+    jobs: list[tuple[PromptSpec, str]] = []
+    job_payloads: list[str] = []
+    job_entries: list[dict] = []
+    slice_cache: dict[tuple[str, str], str] = {}
+
     for spec in PROMPT_REGISTRY:
         # Skip summaries unless requested
         if spec.is_summary and not include_summaries:
@@ -298,9 +845,12 @@ def run_pipeline(
             print(f"  [{spec.name}] SKIPPED (Pass 1 filter)")
             continue
 
-        # Slice the payload
-        slicer_fn = get_slicer(spec.payload_slicer)
-        payload_json = slicer_fn(payloads[spec.checklist])
+        # Slice the payload (slicers are pure, so specs sharing one reuse its JSON)
+        slice_key = (spec.checklist, spec.payload_slicer)
+        payload_json = slice_cache.get(slice_key)
+        if payload_json is None:
+            slicer_fn = get_slicer(spec.payload_slicer)
+            payload_json = slice_cache[slice_key] = slicer_fn(payloads[spec.checklist])
 
         # Skip if empty
         if spec.skip_if_empty and is_empty_slice(payload_json):
@@ -308,8 +858,6 @@ def run_pipeline(
             print(f"  [{spec.name}] SKIPPED (empty payload)")
             continue
 
-        llm_completed += 1
-
         # Fill the prompt template
         prompt_text = fill_template(spec, payload_json)
         prompt_tokens = estimate_tokens(prompt_text)
@@ -320,64 +868,92 @@ def run_pipeline(
             "wcag_criteria": spec.wcag_criteria,
             "prompt_tokens_est": prompt_tokens,
         }
+        # Appended now so the manifest keeps registry order
+        results.append(result_entry)
+
+        if not dry_run:
+            jobs.append((spec, prompt_text))
+            job_payloads.append(payload_json)
+            job_entries.append(result_entry)
+            continue
+
+        # Save just the prompt text
+        save_json(
+            {
+                "prompt_name": spec.name,
+                "checklist": spec.checklist,
+                "wcag_criteria": spec.wcag_criteria,
+                "prompt_index": spec.prompt_index,
+                "prompt_tokens_est": prompt_tokens,
+                "prompt_text": prompt_text,
+                "payload_slice": payload_json,
+            },
+            prompt_dir / f"{spec.name}.json",
+        )
+        result_entry["status"] = "dry_run"
+        print(f"  [{spec.name}] SAVED prompt (~{prompt_tokens:,} tokens)")
+
+        llm_completed += 1
+        if progress_callback:
+            progress_callback({
+                "type": "progress",
+                "stage": "llm_progress",
+                "completed": llm_completed,
+                "total": total_llm_prompts,
+                "prompt_name": spec.name,
+                "message": f"LLM analysis: {spec.name} ({llm_completed}/{total_llm_prompts})",
+            })
 
-        if dry_run:
-            # Save just the prompt text
-            prompt_dir = output_dir / "prompts"
-            prompt_dir.mkdir(parents=True, exist_ok=True)
-            save_json(
-                {
-                    "prompt_name": spec.name,
-                    "checklist": spec.checklist,
-                    "wcag_criteria": spec.wcag_criteria,
-                    "prompt_index": spec.prompt_index,
-                    "prompt_tokens_est": prompt_tokens,
-                    "prompt_text": prompt_text,
-                    "payload_slice": payload_json,
-                },
-                prompt_dir / f"{spec.name}.json",
+    def record_result(index: int, api_result: dict, log=None) -> None:
+        """Save one finished call and fold it into the run totals.
+
+        Status lines go to *log* (stdout when None).
+        """
+        nonlocal total_input_tokens, total_output_tokens, llm_completed
+
+        spec, prompt_text = jobs[index]
+        result_entry = job_entries[index]
+        record = {
+            "prompt_name": spec.name,
+            "checklist": spec.checklist,
+            "wcag_criteria": spec.wcag_criteria,
+            "prompt_file": spec.prompt_file,
+            "prompt_index": spec.prompt_index,
+        }
+        if inline_prompts:
+            record["prompt_text"] = prompt_text
+        record["payload_slice"] = job_payloads[index]
+        record["api_result"] = api_result
+        save_json(record, prompt_dir / f"{spec.name}.json")
+
+        if "usage" in api_result:
+            # Batched members can fail after tokens were already spent
+            total_input_tokens += api_result["usage"]["input_tokens"]
+            total_output_tokens += api_result["usage"]["output_tokens"]
+
+        if api_result["success"]:
+            in_tok = api_result["usage"]["input_tokens"]
+            out_tok = api_result["usage"]["output_tokens"]
+            result_entry["status"] = "success"
+            result_entry["input_tokens"] = in_tok
+            result_entry["output_tokens"] = out_tok
+            result_entry["duration_seconds"] = api_result["duration_seconds"]
+            first_token = ""
+            if "first_token_seconds" in api_result:
+                result_entry["first_token_seconds"] = api_result["first_token_seconds"]
+                first_token = f"first token {api_result['first_token_seconds']}s, "
+            source = "cached, " if api_result.get("cached") else ""
+            print(
+                f"  [{spec.name}] OK ({source}{api_result['duration_seconds']}s, {first_token}"
+                f"{in_tok:,} in / {out_tok:,} out)",
+                file=log,
             )
-            result_entry["status"] = "dry_run"
-            print(f"  [{spec.name}] SAVED prompt (~{prompt_tokens:,} tokens)")
         else:
-            # Call the API
-            print(f"  [{spec.name}] Calling {model} (~{prompt_tokens:,} tokens)...", end="", flush=True)
-            api_result = client.call(prompt_text)
-
-            prompt_dir = output_dir / "prompts"
-            prompt_dir.mkdir(parents=True, exist_ok=True)
-            save_json(
-                {
-                    "prompt_name": spec.name,
-                    "checklist": spec.checklist,
-                    "wcag_criteria": spec.wcag_criteria,
-                    "prompt_index": spec.prompt_index,
-                    "prompt_text": prompt_text,
-                    "payload_slice": payload_json,
-                    "api_result": api_result,
-                },
-                prompt_dir / f"{spec.name}.json",
-            )
-
-            if api_result["success"]:
-                in_tok = api_result["usage"]["input_tokens"]
-                out_tok = api_result["usage"]["output_tokens"]
-                total_input_tokens += in_tok
-                total_output_tokens += out_tok
-                result_entry["status"] = "success"
-                result_entry["input_tokens"] = in_tok
-                result_entry["output_tokens"] = out_tok
-                result_entry["duration_seconds"] = api_result["duration_seconds"]
-                print(
-                    f" OK ({api_result['duration_seconds']}s, "
-                    f"{in_tok:,} in / {out_tok:,} out)"
-                )
-            else:
-                result_entry["status"] = "error"
-                result_entry["error"] = api_result["error"]
-                print(f" FAILED: {api_result['error']}")
+            result_entry["status"] = "error"
+            result_entry["error"] = api_result["error"]
+            print(f"  [{spec.name}] FAILED: {api_result['error']}", file=log)
 
-        results.append(result_entry)
+        llm_completed += 1
         if progress_callback:
             progress_callback({
                 "type": "progress",
@@ -388,6 +964,103 @@ def run_pipeline(
                 "message": f"LLM analysis: {spec.name} ({llm_completed}/{total_llm_prompts})",
             })
 
+    def finish_job(index: int, api_result: dict, log) -> None:
+        """Record a prompt's own result, then every identical prompt's copy."""
+        record_result(index, api_result, log)
+        key = job_keys[index]
+        entry = _cache_entry(api_result)
+        if entry is not None:
+            cached_results[key] = entry
+        for dup in duplicates.get(key, ()):
+            record_result(dup, _reused_result(api_result), log)
+
+    def record_call(call_index: int, api_result: dict, log) -> None:
+        """Route a finished call's result to the prompt(s) it covered."""
+        members = batches[call_index]
+        if len(members) == 1:
+            finish_job(members[0], api_result, log)
+            return
+        names = [jobs[i][0].name for i in members]
+        weights = [len(jobs[i][1]) for i in members]
+        for i, member_result in zip(members, split_batch_result(api_result, names, weights)):
+            finish_job(i, member_result, log)
+
+    # How live prompts were answered: from the cache, by sharing an identical
+    # prompt's call, or by being sent
+    prompt_reuse = {"cache_hits": 0, "duplicates": 0, "sent": 0}
+
+    if jobs:
+        cache_path = output_dir / ".prompt_cache.json"
+        stored_results = load_prompt_cache(cache_path)
+        cached_results = dict(stored_results) if prompt_cache else {}
+
+        # Only the first prompt with a given text is sent; the rest wait on it
+        job_keys = [
+            _prompt_key(model, client.max_tokens, prompt_text) for _, prompt_text in jobs
+        ]
+        pending: list[int] = []
+        duplicates: dict[str, list[int]] = {}
+        for i, key in enumerate(job_keys):
+            if key in cached_results:
+                record_result(i, _reused_result(cached_results[key]))
+                prompt_reuse["cache_hits"] += 1
+            elif key in duplicates:
+                duplicates[key].append(i)
+                prompt_reuse["duplicates"] += 1
+            else:
+                duplicates[key] = []
+                pending.append(i)
+        prompt_reuse["sent"] = len(pending)
+        if prompt_reuse["cache_hits"] or prompt_reuse["duplicates"]:
+            print(
+                f"  Reusing responses: {prompt_reuse['cache_hits']} cached, "
+                f"{prompt_reuse['duplicates']} identical to another prompt"
+            )
+
+        batches = [
+            [pending[j] for j in members]
+            for members in _group_batches([jobs[i][0] for i in pending], batch_size)
+        ]
+        calls = []
+        for members in batches:
+            if len(members) == 1:
+                spec, prompt_text = jobs[members[0]]
+                tokens_est = job_entries[members[0]]["prompt_tokens_est"]
+                calls.append((spec.name, prompt_text, tokens_est))
+                continue
+            names = [jobs[i][0].name for i in members]
+            batch_text = build_batch_prompt(names, [jobs[i][1] for i in members])
+            calls.append(("+".join(names), batch_text, estimate_tokens(batch_text)))
+        if calls and batch_api:
+            print(
+                f"  Submitting {len(pending)} prompt(s) in {len(calls)} request(s) "
+                f"as one Batch API job..."
+            )
+            batch_results = client.call_batch([prompt_text for _, prompt_text, _ in calls])
+            for i, api_result in enumerate(batch_results):
+                record_call(i, api_result, None)
+        elif calls:
+            print(
+                f"  Sending {len(pending)} prompt(s) in {len(calls)} call(s), "
+                f"up to {max_concurrency} at a time..."
+            )
+            asyncio.run(_call_prompts(
+                client, calls, max_concurrency, record_call,
+                requests_per_minute=requests_per_minute,
+                tokens_per_minute=tokens_per_minute,
+            ))
+
+        # Keep only this run's prompts, so the file tracks the latest page
+        # instead of growing with every page audited into this directory.
+        # A failed refresh keeps the stored response.
+        kept_results = {}
+        for key in job_keys:
+            entry = cached_results.get(key) or stored_results.get(key)
+            if entry:
+                kept_results[key] = entry
+        if kept_results != stored_results:
+            save_json(kept_results, cache_path)
+
     # ── Step 3: Write manifest ───────────────────────────────────────────────
     manifest = {
         "run_timestamp": datetime.now(timezone.utc).isoformat(),
@@ -408,11 +1081,15 @@ def run_pipeline(
         "prompts_executed": [r for r in results if r.get("status") != "dry_run"],
         "prompts_dry_run": [r for r in results if r.get("status") == "dry_run"],
         "prompts_skipped": skipped,
+        "prompt_reuse": prompt_reuse,
         "total_input_tokens": total_input_tokens,
         "total_output_tokens": total_output_tokens,
-        "estimated_cost_usd": compute_cost(total_input_tokens, total_output_tokens, model),
+        "batch_api": batch_api,
+        "estimated_cost_usd": compute_cost(
+            total_input_tokens, total_output_tokens, model, batch=batch_api
+        ),
     }
-    save_json(manifest, output_dir / "manifest.json")
+    save_json_pretty(manifest, output_dir / "manifest.json")
 
     return manifest
 
@@ -436,6 +1113,12 @@ def print_summary(manifest: dict, show_cost: bool = False) -> None:
         print(f"Prompts executed: {len(executed)}")
         print(f"  Successful: {len(success)}")
         print(f"  Failed: {len(failed)}")
+        reuse = manifest.get("prompt_reuse", {})
+        if reuse.get("cache_hits") or reuse.get("duplicates"):
+            print(
+                f"  Reused: {reuse['cache_hits']} from cache, "
+                f"{reuse['duplicates']} identical (sent: {reuse['sent']})"
+            )
 
         if manifest["total_input_tokens"] > 0:
             print(f"\nToken usage:")
@@ -444,16 +1127,20 @@ def print_summary(manifest: dict, show_cost: bool = False) -> None:
 
             if show_cost:
                 model = manifest.get("model", "")
+                batch = manifest.get("batch_api", False)
                 cost = compute_cost(
                     manifest["total_input_tokens"],
                     manifest["total_output_tokens"],
                     model,
+                    batch=batch,
                 )
                 if cost is not None:
                     print(f"\nEstimated cost:")
                     pricing = get_pricing(model)
                     print(f"  Model: {model}")
                     print(f"  Rate:  ${pricing[0]:.2f} / 1M input, ${pricing[1]:.2f} / 1M output")
+                    if batch:
+                        print(f"  Batch API discount: {1 - BATCH_API_DISCOUNT:.0%}")
                     print(f"  Total: ${cost:.4f}")
                 else:
                     print(f"\nCost: unknown pricing for model '{model}'")
@@ -502,6 +1189,50 @@ def main():
         action="store_true",
         help="Print estimated dollar cost of the run based on model pricing",
     )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=f"Maximum LLM requests in flight at once (default: {DEFAULT_MAX_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--rpm",
+        type=float,
+        default=None,
+        help="Pace LLM calls to at most this many requests per minute (default: unlimited)",
+    )
+    parser.add_argument(
+        "--tpm",
+        type=float,
+        default=None,
+        help="Pace LLM calls to at most this many estimated input tokens per "
+             "minute (default: unlimited)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1,
+        help="Combine up to N prompts from the same checklist into one API call "
+             "(default: 1, no batching)",
+    )
+    parser.add_argument(
+        "--no-prompt-cache",
+        action="store_true",
+        help="Call the API for every prompt instead of reusing responses "
+             "saved in OUTPUT_DIR/.prompt_cache.json, and replace them with "
+             "the fresh ones",
+    )
+    parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Send live prompts as one provider Batch API job (about half the "
+             "cost; the run waits for it, up to 24 hours)",
+    )
+    parser.add_argument(
+        "--inline-prompts",
+        action="store_true",
+        help="Also store the full filled prompt text in live prompt files",
+    )
     parser.add_argument(
         "--env-file",
         type=str,
@@ -509,6 +1240,13 @@ def main():
         help="Path to .env file (default: .env)",
     )
     args = parser.parse_args()
+    if args.max_concurrency < 1:
+        parser.error("--max-concurrency must be at least 1")
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+    for flag, value in (("--rpm", args.rpm), ("--tpm", args.tpm)):
+        if value is not None and value <= 0:
+            parser.error(f"{flag} must be positive")
 
     # Load environment
     load_dotenv(args.env_file)
@@ -549,6 +1287,13 @@ def main():
         model=args.model,
         dry_run=args.dry_run,
         include_summaries=args.include_summaries,
+        max_concurrency=args.max_concurrency,
+        batch_size=args.batch_size,
+        requests_per_minute=args.rpm,
+        tokens_per_minute=args.tpm,
+        prompt_cache=not args.no_prompt_cache,
+        batch_api=args.batch_api,
+        inline_prompts=args.inline_prompts,
     )
     manifest["output_dir"] = str(output_dir)
     print_summary(manifest, show_cost=args.show_cost)
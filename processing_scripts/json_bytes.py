@@ -0,0 +1,33 @@
+"""Serialize JSON to UTF-8 bytes, with orjson when it is installed.
+
+Shared by the pipeline's output files and the API servers' responses.
+orjson is an optional speedup (the ``fast`` extra); the stdlib encoder is
+used otherwise and produces the same layout.
+"""
+
+from __future__ import annotations
+
+import json
+
+try:
+    import orjson
+except ImportError:  # optional speedup — stdlib json is used otherwise
+    orjson = None
+
+
+def dumps_bytes(obj: object, *, pretty: bool = False) -> bytes:
+    """Serialize *obj* to UTF-8 JSON bytes, compact or indented by two spaces.
+
+    Anything orjson refuses (non-string keys, very large ints) is retried
+    with the stdlib encoder, which produces the same layout.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+        except orjson.JSONEncodeError:
+            pass
+    if pretty:
+        text = json.dumps(obj, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    return text.encode("utf-8")
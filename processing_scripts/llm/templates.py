@@ -55,34 +55,49 @@ def _parse_prompt_file(file_path: Path) -> dict[int, str]:
     return prompts
 
 
-def get_template(spec: PromptSpec) -> str:
-    """Load the raw template text for a PromptSpec (before payload substitution)."""
-    file_path = PROJECT_ROOT / spec.prompt_file
-    prompts = _parse_prompt_file(file_path)
-    if spec.prompt_index not in prompts:
+def _lookup_template(prompt_file: str, prompt_index: int) -> str:
+    """Return the raw template text for one numbered prompt in a .txt file."""
+    prompts = _parse_prompt_file(PROJECT_ROOT / prompt_file)
+    if prompt_index not in prompts:
         raise KeyError(
-            f"Prompt index {spec.prompt_index} not found in {spec.prompt_file}. "
+            f"Prompt index {prompt_index} not found in {prompt_file}. "
             f"Available: {sorted(prompts.keys())}"
         )
-    return prompts[spec.prompt_index]
+    return prompts[prompt_index]
 
 
-def fill_template(spec: PromptSpec, payload_json: str) -> str:
-    """Load the template for a PromptSpec and replace {payload} with the given JSON string.
+def get_template(spec: PromptSpec) -> str:
+    """Load the raw template text for a PromptSpec (before payload substitution)."""
+    return _lookup_template(spec.prompt_file, spec.prompt_index)
 
-    A shared judgement-vs-programmatic preamble is injected just before the
-    ``Data: {payload}`` line so that every prompt gets consistent guidance
-    without duplicating the block in each .txt file.
+
+@lru_cache(maxsize=None)
+def _prepared_template(name: str, prompt_file: str, prompt_index: int) -> tuple[str, ...]:
+    """Return one prompt's template, preamble injected, split at ``{payload}``.
+
+    Cached so the section lookup, placeholder check, preamble splice and
+    placeholder search run once per prompt rather than on every fill.
     """
-    template = get_template(spec)
+    template = _lookup_template(prompt_file, prompt_index)
     if "{payload}" not in template:
         raise ValueError(
-            f"Template for '{spec.name}' (index {spec.prompt_index} in "
-            f"{spec.prompt_file}) does not contain a {{payload}} placeholder."
+            f"Template for '{name}' (index {prompt_index} in "
+            f"{prompt_file}) does not contain a {{payload}} placeholder."
         )
     # Inject the shared preamble right before the payload marker.
     template = template.replace(
         "Data: {payload}",
         f"{_JUDGEMENT_PREAMBLE}\n\nData: {{payload}}",
     )
-    return template.replace("{payload}", payload_json)
+    return tuple(template.split("{payload}"))
+
+
+def fill_template(spec: PromptSpec, payload_json: str) -> str:
+    """Load the template for a PromptSpec and replace {payload} with the given JSON string.
+
+    A shared judgement-vs-programmatic preamble is injected just before the
+    ``Data: {payload}`` line so that every prompt gets consistent guidance
+    without duplicating the block in each .txt file.
+    """
+    parts = _prepared_template(spec.name, spec.prompt_file, spec.prompt_index)
+    return payload_json.join(parts)
@@ -62,9 +62,14 @@ def label_source(label_el, wrapping_label, aria_label, aria_labelledby_text,
 
 
 def extract(file_path):
+    """Parse the HTML file at *file_path* and build the CL02 forms payload."""
     with open(file_path, "r", encoding="utf-8") as f:
         soup = BeautifulSoup(f, "lxml")
+    return extract_from_soup(soup)
 
+
+def extract_from_soup(soup):
+    """Build the CL02 forms payload from a parsed document."""
     payload = {}
 
     # ── FORMS ─────────────────────────────────────────────────────────────────
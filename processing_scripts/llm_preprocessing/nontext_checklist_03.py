@@ -90,9 +90,14 @@ def alt_flags(alt_text):
 
 
 def extract(file_path):
+    """Parse the HTML file at *file_path* and build the CL03 non-text content payload."""
     with open(file_path, "r", encoding="utf-8") as f:
         soup = BeautifulSoup(f, "lxml")
+    return extract_from_soup(soup)
 
+
+def extract_from_soup(soup):
+    """Build the CL03 non-text content payload from a parsed document."""
     payload = {}
 
     # ── IMAGES ────────────────────────────────────────────────────────────────
@@ -47,9 +47,14 @@ def estimate_tokens(text):
 
 
 def extract(file_path):
+    """Parse the HTML file at *file_path* and build the CL01 semantic-structure payload."""
     with open(file_path, "r", encoding="utf-8") as f:
         soup = BeautifulSoup(f, "lxml")
+    return extract_from_soup(soup)
 
+
+def extract_from_soup(soup):
+    """Build the CL01 semantic-structure payload from a parsed document."""
     payload = {}
 
     # ── LANGUAGE ──────────────────────────────────────────────────────────────
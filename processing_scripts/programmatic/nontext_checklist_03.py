@@ -4,6 +4,8 @@ import sys
 import os
 from bs4 import BeautifulSoup
 
+from vision_aid.ingestion.pull_html import read_html
+
 
 # ==========================================================
 # UTILITY FUNCTIONS
@@ -66,8 +68,7 @@ def issue(rule_id, rule_name, element, description):
 
 def audit_nontext(file_path):
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        soup = BeautifulSoup(f.read(), "lxml")
+    soup = BeautifulSoup(read_html(file_path), "lxml")
 
     results = []
 
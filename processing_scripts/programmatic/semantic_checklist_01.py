@@ -5,6 +5,8 @@ import os
 import re
 from bs4 import BeautifulSoup
 
+from vision_aid.ingestion.pull_html import read_html
+
 
 # ==========================================================
 # CONSTANTS
@@ -86,8 +88,7 @@ def issue(rule_id, rule_name, element, description):
 
 def audit_html_file(file_path):
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        soup = BeautifulSoup(f.read(), "lxml")
+    soup = BeautifulSoup(read_html(file_path), "lxml")
 
     results = []
 
@@ -1,10 +1,11 @@
-import requests
 from datetime import datetime
 from typing import Optional, List, Set
 from urllib.parse import urljoin, urlparse
 import re
 import time
 
+from vision_aid.ingestion.pull_html import DEFAULT_TIMEOUT, get_session
+
 def download_html(url: str, filename: Optional[str] = None, depth: int = 1, 
                   visited: Optional[Set[str]] = None, base_domain: Optional[str] = None) -> List[str]:
     """
@@ -38,7 +39,7 @@ def download_html(url: str, filename: Optional[str] = None, depth: int = 1,
     
     try:
         print(f"Downloading: {url} (depth: {depth})")
-        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'})
+        response = get_session().get(url, timeout=DEFAULT_TIMEOUT)
         response.raise_for_status()
         
         # Generate filename
@@ -141,9 +142,13 @@ def extract_links(html_content: str, base_url: str) -> Set[str]:
     return links
 
 def fetch_page(url: str, timeout: int = 30) -> str:
-    """Fetch a single URL and return its HTML content as a string."""
+    """Fetch a single URL and return its HTML content as a string.
+
+    Used for interactive API requests, so the request is not retried and a
+    stalled host fails after *timeout* seconds.
+    """
     print(f"[fetch_page] GET {url}")
-    response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=timeout)
+    response = get_session(retry=False).get(url, timeout=timeout)
     print(f"[fetch_page] Status: {response.status_code}")
     print(f"[fetch_page] Content-Type: {response.headers.get('Content-Type', 'unknown')}")
     print(f"[fetch_page] Content-Length (bytes): {len(response.content):,}")
@@ -173,7 +178,8 @@ def fetch_pages_nested(url: str, max_depth: int = 1,
                        max_links_per_page: int = 10, timeout: int = 30) -> tuple:
     """Fetch HTML from *url* and its in-domain links up to *max_depth* levels.
 
-    All pages are concatenated with HTML comment separators.
+    All pages are concatenated with HTML comment separators. As in
+    :func:`fetch_page`, requests are not retried.
 
     Returns:
         Tuple of (html_str, tree) where *tree* maps each crawled URL to the
@@ -197,8 +203,7 @@ def fetch_pages_nested(url: str, max_depth: int = 1,
         tree.setdefault(current_url, [])  # ensure node exists even if leaf
 
         try:
-            resp = requests.get(current_url, headers={'User-Agent': 'Mozilla/5.0'},
-                                timeout=timeout)
+            resp = get_session(retry=False).get(current_url, timeout=timeout)
             resp.raise_for_status()
             parts.append(f"<!-- PAGE: {current_url} -->\n{resp.text}")
             if depth > 0:
@@ -1,18 +1,66 @@
+import gzip
+import re
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from functools import partial
+from pathlib import Path
+from typing import List, Optional
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-def download_html(url:str, filename:Optional[str]):
+def _new_session(max_retries) -> requests.Session:
+    """Build a session with a 32-connection pool for http and https."""
+    session = requests.Session()
+    session.headers['User-Agent'] = 'Mozilla/5.0'
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=max_retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+# Pooled sessions shared by every download, so repeat requests to a host
+# reuse its TCP/TLS connection. The default one retries 429s and 5xx
+# responses with backoff; the other fails fast for interactive callers.
+_SESSION = _new_session(Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=(429, 500, 502, 503, 504)))
+_SESSION_NO_RETRY = _new_session(0)
+
+# (connect, read) timeout in seconds, so a stalled server cannot hang a download
+DEFAULT_TIMEOUT = (5, 30)
+
+def get_session(retry: bool = True) -> requests.Session:
+    """
+    Return a shared pooled session.
+
+    With *retry*, 429s, 5xx responses and connection errors are retried up
+    to three times, and a request that keeps failing raises
+    ``requests.exceptions.RetryError``. Without it each request is made
+    once, and ``raise_for_status`` raises ``HTTPError`` as usual.
+    """
+    return _SESSION if retry else _SESSION_NO_RETRY
+
+def download_html(url:str, filename:Optional[str] = None, compress:bool = False):
+    """
+    Download *url* and save its HTML to *filename*.
+
+    With *compress*, or when *filename* ends in ".gz", the file is written
+    gzip-compressed (a ".gz" suffix is added if missing); read it back with
+    :func:`read_html`. Returns the saved filename, or None on failure.
+    """
     try:
-        response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'})
+        response = _SESSION.get(url, timeout=DEFAULT_TIMEOUT)
         response.raise_for_status()
         
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             domain = url.replace('https://', '').replace('http://', '').split('/')[0]
             filename = f"{domain}_{timestamp}.html"
+        if compress and not filename.endswith('.gz'):
+            filename += '.gz'
         
-        with open(filename, 'w', encoding='utf-8') as f:
+        opener = gzip.open if filename.endswith('.gz') else open
+        with opener(filename, 'wt', encoding='utf-8') as f:
             f.write(response.text)
         
         print(f"HTML saved to {filename}")
@@ -22,5 +70,44 @@ def download_html(url:str, filename:Optional[str]):
         print(f"Error: {e}")
         return None
 
+def download_many(urls: List[str], out_dir: Path, concurrency: int = 16,
+                  compress: bool = False) -> List[Optional[str]]:
+    """
+    Download several URLs concurrently into *out_dir*.
+
+    Up to *concurrency* downloads run at once over the shared session.
+    Files are named after each URL's domain, path and position in *urls*,
+    so URLs differing only in their query string (or listed twice) never
+    share a file; they are gzip-compressed with *compress*, as in
+    :func:`download_html`. Returns the saved
+    filename for each URL, in order, or None where the download failed.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+    filenames = []
+    for i, url in enumerate(urls):
+        parsed = urlparse(url)
+        path_part = parsed.path.replace('/', '_').strip('_') or 'index'
+        # Hostname drops any port; anything outside [A-Za-z0-9._-] (":",
+        # "%", "?") is not safe in a filename on every platform.
+        stem = re.sub(r"[^A-Za-z0-9._-]", "_", f"{parsed.hostname}_{path_part}")
+        filenames.append(str(out_dir / f"{stem}_{timestamp}_{i}.html"))
+
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(urls)))) as pool:
+        return list(pool.map(partial(download_html, compress=compress), urls, filenames))
+
+def read_html(path, errors: str = 'strict') -> str:
+    """
+    Return the HTML text of a file, such as one saved by :func:`download_html`.
+
+    Gzip-compressed (".gz") files are decompressed transparently. *errors*
+    is the UTF-8 decoding error handler, as for :func:`open`.
+    """
+    opener = gzip.open if str(path).endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8', errors=errors) as f:
+        return f.read()
+
 if __name__=='__main__':
     download_html("https://visionaid.org/")
\ No newline at end of file
@@ -5,6 +5,7 @@ pre-built JSON payloads, collects responses, and aggregates token usage.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from .client import AuditClient
@@ -16,6 +17,7 @@ def run_checklist(
     slices: dict[str, Any | None],
     *,
     verbose: bool = True,
+    max_concurrency: int = 1,
 ) -> dict[str, Any]:
     """
     Run every prompt in *prompts* against the matching payload slice in *slices*.
@@ -31,6 +33,9 @@ def run_checklist(
         Labels are used as keys in the returned results dict.
     verbose : bool
         Print progress to stdout while running.
+    max_concurrency : int
+        Number of API calls to keep in flight at once (default: 1, one
+        after another). Results and progress lines keep prompt order.
 
     Returns
     -------
@@ -46,6 +51,9 @@ def run_checklist(
     total_input = 0
     total_output = 0
 
+    # One step per label, in prompt order: a SKIPPED line or a job to run.
+    steps: list[str | tuple[int, str, str, Any]] = []
+
     # Map labels → prompt numbers by position (label order == prompt order)
     labels = list(slices.keys())
 
@@ -54,39 +62,67 @@ def run_checklist(
         payload = slices[label]
 
         if payload is None:
-            if verbose:
-                print(f"  [{prompt_num}] {label} — SKIPPED (filtered by Pass 1)")
+            steps.append(f"  [{prompt_num}] {label} — SKIPPED (filtered by Pass 1)")
             skipped.append(label)
             continue
 
         # Skip if the payload is empty after filtering
         if _is_empty_payload(payload):
-            if verbose:
-                print(f"  [{prompt_num}] {label} — SKIPPED (empty payload after filtering)")
+            steps.append(f"  [{prompt_num}] {label} — SKIPPED (empty payload after filtering)")
             skipped.append(label)
             continue
 
         prompt_text = prompts.get(prompt_num)
         if prompt_text is None:
-            if verbose:
-                print(f"  [{prompt_num}] {label} — SKIPPED (no prompt text found)")
+            steps.append(f"  [{prompt_num}] {label} — SKIPPED (no prompt text found)")
             skipped.append(label)
             continue
 
-        if verbose:
-            print(f"  [{prompt_num}] {label} ...", end=" ", flush=True)
+        steps.append((prompt_num, label, prompt_text, payload))
+
+    jobs = [step for step in steps if not isinstance(step, str)]
 
+    def call(job: tuple[int, str, str, Any]) -> tuple[Any, dict | None, Exception | None]:
+        """Run one job, returning (response, usage, None) or (None, None, exc)."""
+        _, _, prompt_text, payload = job
         try:
             response, usage = client.call(prompt_text, payload)
-            results[label] = response
-            total_input += usage["input_tokens"]
-            total_output += usage["output_tokens"]
-            if verbose:
-                print(f"✓ ({usage['input_tokens']}in / {usage['output_tokens']}out tokens)")
         except Exception as exc:
+            return None, None, exc
+        return response, usage, None
+
+    def record(label: str, outcome: tuple[Any, dict | None, Exception | None], prefix: str) -> None:
+        """Store one job's outcome, add its usage and print its result line."""
+        nonlocal total_input, total_output
+        response, usage, exc = outcome
+        if exc is not None:
             errors[label] = str(exc)
             if verbose:
-                print(f"✗ ERROR: {exc}")
+                print(f"{prefix}✗ ERROR: {exc}")
+            return
+        results[label] = response
+        total_input += usage["input_tokens"]
+        total_output += usage["output_tokens"]
+        if verbose:
+            print(f"{prefix}✓ ({usage['input_tokens']}in / {usage['output_tokens']}out tokens)")
+
+    workers = max(1, min(max_concurrency, len(jobs)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        # The API clients are thread-safe; map() yields results in prompt order.
+        outcomes = pool.map(call, jobs) if workers > 1 else None
+        for step in steps:
+            if isinstance(step, str):
+                if verbose:
+                    print(step)
+                continue
+            prompt_num, label, _, _ = step
+            if outcomes is None:
+                # Sequential: show each prompt's label while its call is in progress.
+                if verbose:
+                    print(f"  [{prompt_num}] {label} ...", end=" ", flush=True)
+                record(label, call(step), "")
+            else:
+                record(label, next(outcomes), f"  [{prompt_num}] {label} ... ")
 
     return {
         "results": results,
@@ -102,6 +138,7 @@ def run_all(
     all_slices: dict[str, dict[str, Any | None]],
     *,
     verbose: bool = True,
+    max_concurrency: int = 1,
 ) -> dict[str, Any]:
     """
     Run all checklists in *all_slices* and return a consolidated report dict.
@@ -114,6 +151,8 @@ def run_all(
     all_slices : dict[str, dict[str, payload|None]]
         ``{checklist_stem: {label: payload|None}}``.
     verbose : bool
+    max_concurrency : int
+        Passed to :func:`run_checklist` for each checklist.
 
     Returns
     -------
@@ -130,7 +169,9 @@ def run_all(
         if verbose:
             print(f"\n--- {stem} ---")
 
-        result = run_checklist(client, prompts, slices, verbose=verbose)
+        result = run_checklist(
+            client, prompts, slices, verbose=verbose, max_concurrency=max_concurrency
+        )
         checklists[stem] = result
         grand_input += result["usage"]["input_tokens"]
         grand_output += result["usage"]["output_tokens"]
@@ -1,5 +1,6 @@
 from abc import abstractmethod, ABC
 from bs4 import BeautifulSoup
+from vision_aid.ingestion.pull_html import read_html
 import sys
 
 class AuditBase(ABC):
@@ -91,9 +92,7 @@ class AuditBase(ABC):
             print()
     
     def get_soup(self):
-        with open(self.file_path, "r", encoding="utf-8") as f:
-            soup = BeautifulSoup(f.read(), "lxml")
-        return soup
+        return BeautifulSoup(read_html(self.file_path), "lxml")
     
     @abstractmethod
     def run_audit(self):